@@ -1,8 +1,25 @@
 from flask import Flask
+from werkzeug.exceptions import HTTPException
+from app.json_provider import OrjsonProvider
 
 def create_app():
     app = Flask(__name__)
 
+    # Serialize responses with orjson (compact, unsorted, NumPy-aware)
+    app.json = OrjsonProvider(app)
+
+    # Reject request bodies (JSON or uploads) larger than 1 MiB
+    app.config['MAX_CONTENT_LENGTH'] = 1 << 20
+
+    # Report HTTP errors raised by Flask/Werkzeug as JSON, like the route errors
+    # (the error's own response is reused so headers such as Allow are kept)
+    @app.errorhandler(HTTPException)
+    def handle_http_exception(e):
+        response = e.get_response()
+        response.data = app.json.dumps({"error": e.description})
+        response.content_type = app.json.mimetype
+        return response
+
     # Import blueprint inside create_app to avoid circular imports
     from app.api.z_test_api import z_test_api
     app.register_blueprint(z_test_api, url_prefix='/ztest')
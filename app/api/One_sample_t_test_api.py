@@ -1,5 +1,10 @@
 from flask import Blueprint, request, jsonify
+from werkzeug.exceptions import HTTPException
+from scipy.special import stdtr, stdtrit
 from scipy.stats import t
+from functools import lru_cache
+from collections import namedtuple
+import numpy as np
 import math
 from app.logger import logger
 
@@ -7,47 +12,139 @@ from app.logger import logger
 # Blueprint setup
 t_test_api = Blueprint("t_test_api", __name__)
 
+# Parsed request parameters
+OneSampleTTestInput = namedtuple(
+    "OneSampleTTestInput",
+    "sample_mean population_mean sample_std sample_size confidence_level alternative dataset_id",
+)
+REQUIRED_FIELDS = ("sample_mean", "population_mean", "sample_std", "sample_size")
+NUMERIC_FIELDS = REQUIRED_FIELDS + ("confidence_level",)
+
+# p-value for each alternative hypothesis, as a function of (t_score, df)
+# (upper tails use stdtr(df, -x) rather than 1 - cdf to keep precision)
+P_VALUE_FUNCTIONS = {
+    "greater": lambda t_score, df: stdtr(df, -t_score),
+    "less": lambda t_score, df: stdtr(df, t_score),
+    "not_equal": lambda t_score, df: 2 * stdtr(df, -abs(t_score)),
+}
+
 # ---------------------------------------------
 # Helper Functions
 # ---------------------------------------------
-def validate_inputs(data, required_fields):
+def parse_inputs(data):
     """
-    Validate that all required fields are present and non-null in the input data.
+    Validate that all required fields are present and numeric, and extract all parameters in one pass.
     :param data: Dictionary containing input data
-    :param required_fields: List of required field names
-    :return: (bool, str) - Validation status and error message (if any)
+    :return: (OneSampleTTestInput or None, str) - Parsed parameters and error message (if any)
+    """
+    get = data.get
+    for field in REQUIRED_FIELDS:
+        if get(field) is None:
+            return None, f"Missing required parameter: {field}."
+    params = OneSampleTTestInput(
+        data["sample_mean"],
+        data["population_mean"],
+        data["sample_std"],
+        data["sample_size"],
+        get("confidence_level", 0.95),
+        get("alternative", "not_equal"),  # "greater", "less", or "not_equal"
+        get("dataset_id", "default_dataset"),
+    )
+    # Numeric parameters must be plain numbers (they are also the cache key of the t-test)
+    for field in NUMERIC_FIELDS:
+        value = getattr(params, field)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None, f"Parameter {field} must be a number."
+    return params, ""
+
+@lru_cache(maxsize=512)
+def t_critical_value(confidence_level, df):
+    """
+    Two-tailed critical value of the t-distribution (cached per confidence level and df).
+    :param confidence_level: Confidence level (e.g., 0.95)
+    :param df: Degrees of freedom
+    :return: Critical value
     """
-    for field in required_fields:
-        if field not in data or data[field] is None:
-            return False, f"Missing required parameter: {field}."
-    return True, ""
+    return stdtrit(df, (1 + confidence_level) / 2)
 
-def calculate_confidence_interval(sample_mean, sample_std, sample_size, confidence_level, df):
+def calculate_confidence_interval(sample_mean, inv_se, confidence_level, df):
     """
     Calculate the confidence interval for the t-test.
     :param sample_mean: Sample mean
-    :param sample_std: Sample standard deviation
-    :param sample_size: Sample size
+    :param inv_se: Reciprocal of the standard error, sqrt(sample_size) / sample_std
     :param confidence_level: Confidence level (e.g., 0.95)
     :param df: Degrees of freedom
     :return: (lower_bound, upper_bound) of the confidence interval
     """
-    critical_value = t.ppf((1 + confidence_level) / 2, df)
-    margin_of_error = critical_value * (sample_std / math.sqrt(sample_size))
+    critical_value = t_critical_value(confidence_level, df)
+    margin_of_error = critical_value / inv_se
     return sample_mean - margin_of_error, sample_mean + margin_of_error
 
-def generate_t_distribution_data(df, x_range=(-5, 5), step=0.1):
+def _x_grid(x_range, step):
+    """
+    Build the read-only x values of the t-distribution graph.
+    """
+    x_values = np.round(np.arange(int(x_range[0] / step), int(x_range[1] / step) + 1) * step, 2)
+    x_values.flags.writeable = False
+    return x_values
+
+# The graph almost always uses the default range and step, so its x values are built once at import
+DEFAULT_X_RANGE = (-5, 5)
+DEFAULT_STEP = 0.1
+DEFAULT_X_VALUES = _x_grid(DEFAULT_X_RANGE, DEFAULT_STEP)
+
+def generate_t_distribution_data(df, x_range=DEFAULT_X_RANGE, step=DEFAULT_STEP):
     """
     Generate x and y values for the t-distribution graph.
     :param df: Degrees of freedom
     :param x_range: Range of x values (default: -5 to 5)
     :param step: Step size for x values (default: 0.1)
-    :return: x_values, y_values
+    :return: x_values, y_values as read-only NumPy arrays
+    """
+    return _t_distribution_grid(df, tuple(x_range), step)
+
+@lru_cache(maxsize=512)
+def _t_distribution_grid(df, x_range, step):
     """
-    x_values = [round(x, 2) for x in [i * step for i in range(int(x_range[0] / step), int(x_range[1] / step) + 1)]]
-    y_values = [t.pdf(x, df) for x in x_values]
+    Compute the t-distribution graph data once per (df, x_range, step).
+    The arrays are shared between requests, so they are made read-only.
+    """
+    if x_range == DEFAULT_X_RANGE and step == DEFAULT_STEP:
+        x_values = DEFAULT_X_VALUES
+    else:
+        x_values = _x_grid(x_range, step)
+    y_values = t.pdf(x_values, df)
+    y_values.flags.writeable = False
     return x_values, y_values
 
+@lru_cache(maxsize=1024, typed=True)
+def calculate_one_sample_t_test(sample_mean, population_mean, sample_std, sample_size, confidence_level, alternative):
+    """
+    Perform a one-sample t-test from summary statistics.
+    The result depends only on the arguments, so repeated requests are served from the cache.
+    :param sample_mean: Sample mean
+    :param population_mean: Hypothesized population mean
+    :param sample_std: Sample standard deviation
+    :param sample_size: Sample size
+    :param confidence_level: Confidence level (e.g., 0.95)
+    :param alternative: "greater", "less", or "not_equal"
+    :return: (t_score, p_value, df, (lower_bound, upper_bound))
+    """
+    # Calculate t-score (inv_se is reused for the confidence interval)
+    inv_se = math.sqrt(sample_size) / sample_std
+    t_score = (sample_mean - population_mean) * inv_se
+
+    # Degrees of freedom
+    df = sample_size - 1
+
+    # Calculate p-value based on the alternative hypothesis
+    p_value = P_VALUE_FUNCTIONS[alternative](t_score, df)
+
+    # Calculate confidence interval
+    confidence_interval = calculate_confidence_interval(sample_mean, inv_se, confidence_level, df)
+
+    return t_score, p_value, df, confidence_interval
+
 # ---------------------------------------------
 # API Route
 # ---------------------------------------------
@@ -59,24 +156,18 @@ def one_sample_t_test():
         logger.info("Received a request to perform one sample t-test.")
 
         # Extract data from request
-        data = request.json
+        data = request.get_json(cache=False)
         if not data:
             return jsonify({"error": "No input data provided."}), 400
+        if not isinstance(data, dict):
+            return jsonify({"error": "Input JSON must be an object."}), 400
 
-        # Required parameters
-        required_fields = ["sample_mean", "population_mean", "sample_std", "sample_size"]
-        is_valid, error_message = validate_inputs(data, required_fields)
-        if not is_valid:
+        # Validate and retrieve parameters with defaults
+        params, error_message = parse_inputs(data)
+        if params is None:
             return jsonify({"error": error_message}), 400
-
-        # Retrieve parameters with defaults
-        dataset_id = data.get("dataset_id", "default_dataset")
-        sample_mean = data["sample_mean"]
-        population_mean = data["population_mean"]
-        sample_std = data["sample_std"]
-        sample_size = data["sample_size"]
-        confidence_level = data.get("confidence_level", 0.95)
-        alternative = data.get("alternative", "not_equal")  # "greater", "less", or "not_equal"
+        (sample_mean, population_mean, sample_std, sample_size,
+         confidence_level, alternative, dataset_id) = params
 
         # Validate numeric inputs
         if sample_size <= 1:
@@ -85,32 +176,18 @@ def one_sample_t_test():
             return jsonify({"error": "Sample standard deviation must be greater than zero."}), 400
         if not (0 < confidence_level < 1):
             return jsonify({"error": "Confidence level must be between 0 and 1 (exclusive)."}), 400
-
-        # Calculate t-score
-        t_score = (sample_mean - population_mean) / (sample_std / math.sqrt(sample_size))
-
-        # Degrees of freedom
-        df = sample_size - 1
-
-        # Calculate p-value based on the alternative hypothesis
-        if alternative == "greater":
-            p_value = 1 - t.cdf(t_score, df)
-        elif alternative == "less":
-            p_value = t.cdf(t_score, df)
-        elif alternative == "not_equal":
-            p_value = 2 * (1 - t.cdf(abs(t_score), df))
-        else:
+        if not isinstance(alternative, str) or alternative not in P_VALUE_FUNCTIONS:
             return jsonify({"error": f"Invalid alternative hypothesis: {alternative}. Use 'greater', 'less', or 'not_equal'."}), 400
 
+        # Perform the t-test
+        t_score, p_value, df, (confidence_interval_lower, confidence_interval_upper) = calculate_one_sample_t_test(
+            sample_mean, population_mean, sample_std, sample_size, confidence_level, alternative
+        )
+
         # Determine conclusion
         alpha = 1 - confidence_level
         conclusion = "Reject null hypothesis" if p_value < alpha else "Fail to reject null hypothesis"
 
-        # Calculate confidence interval
-        confidence_interval_lower, confidence_interval_upper = calculate_confidence_interval(
-            sample_mean, sample_std, sample_size, confidence_level, df
-        )
-
         # Generate t-distribution data for graph
         x_values, y_values = generate_t_distribution_data(df)
 
@@ -132,6 +209,9 @@ def one_sample_t_test():
             }
         }), 200
 
+    except HTTPException:
+        # Let Flask answer request errors (e.g. 413 body too large) with their own status
+        raise
     except Exception as e:
-        logger.error(f"Error during one-sample t-test: {str(e)}")
+        logger.error("Error during one-sample t-test: %s", e)
         return jsonify({"error": str(e)}), 500
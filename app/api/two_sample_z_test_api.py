@@ -1,12 +1,62 @@
-import math
-from scipy.stats import norm
+from operator import itemgetter
 from flask import Blueprint, request, jsonify
-from app.utils import read_input_data, prepare_output_data
+from werkzeug.exceptions import HTTPException
+from app.utils import (
+    read_input_data, validate_two_sample_input, prepare_output_data,
+    calculate_two_sample_z_test, calculate_two_sample_z_test_batch,
+)
 from app.logger import logger
 
 # Initialize the Blueprint
 two_sample_z_test = Blueprint('two_sample_z_test', __name__)
 
+TWO_SAMPLE_FIELDS = ('dataset_id', 'mean1', 'mean2', 'std1', 'std2', 'n1', 'n2')
+_get_two_sample_fields = itemgetter(*TWO_SAMPLE_FIELDS)
+
+def check_two_sample_fields(data):
+    """
+    Check that the JSON input is an object holding every Two-Sample Z-Test field.
+    :param data: Parsed JSON input
+    :return: str - Error message, or "" if the input is complete
+    """
+    if not isinstance(data, dict):
+        return "Input JSON must be an object."
+    for field in TWO_SAMPLE_FIELDS:
+        if field not in data:
+            return f"Missing required parameter: {field}."
+    return ""
+
+def extract_two_sample_params(data):
+    """
+    Extract and cast the Two-Sample Z-Test parameters in a single lookup.
+    :param data: Mapping with dataset_id, mean1, mean2, std1, std2, n1 and n2
+    :return: (dataset_id, mean1, mean2, std1, std2, n1, n2)
+    """
+    dataset_id, mean1, mean2, std1, std2, n1, n2 = _get_two_sample_fields(data)
+    return dataset_id, float(mean1), float(mean2), float(std1), float(std2), int(n1), int(n2)
+
+def build_two_sample_results(dataset_id, z_score, p_value, mean_difference, confidence_interval):
+    """
+    Build the Two-Sample Z-Test results returned by the single and batch routes.
+    :param dataset_id: Dataset identifier
+    :param z_score: Z-Score(s)
+    :param p_value: P-Value(s)
+    :param mean_difference: Difference(s) of the sample means
+    :param confidence_interval: (lower_bound, upper_bound) of the confidence interval(s)
+    :return: Results dictionary
+    """
+    ci_low, ci_high = confidence_interval
+    return {
+        "dataset_id": dataset_id,
+        "z_score": z_score,
+        "p_value": p_value,
+        "mean_difference": mean_difference,
+        "confidence_interval": {
+            "lower_bound": ci_low,
+            "upper_bound": ci_high
+        }
+    }
+
 @two_sample_z_test.route('/', methods=['POST'])
 def two_sample_z_test_func():
     try:
@@ -16,26 +66,19 @@ def two_sample_z_test_func():
 
         # Check if JSON or file input is provided
         if request.is_json:
-            data = request.get_json()
+            data = request.get_json(cache=False)
             if not data:
                 return jsonify({"error": "No input data provided."}), 400
-            dataset_id = data['dataset_id']
-            mean1 = float(data['mean1'])
-            mean2 = float(data['mean2'])
-            std1 = float(data['std1'])
-            std2 = float(data['std2'])
-            n1 = int(data['n1'])
-            n2 = int(data['n2'])
+            error_message = check_two_sample_fields(data)
+            if error_message:
+                return jsonify({"error": error_message}), 400
+            dataset_id, mean1, mean2, std1, std2, n1, n2 = extract_two_sample_params(data)
         elif 'file' in request.files:
             file = request.files['file']
-            data = read_input_data(file)  # Assuming this function processes the uploaded file
-            dataset_id = data['dataset_id']
-            mean1 = float(data['mean1'])
-            mean2 = float(data['mean2'])
-            std1 = float(data['std1'])
-            std2 = float(data['std2'])
-            n1 = int(data['n1'])
-            n2 = int(data['n2'])
+            # validate_two_sample_input already casts the values
+            dataset_id, mean1, mean2, std1, std2, n1, n2 = _get_two_sample_fields(
+                validate_two_sample_input(read_input_data(file=file))
+            )
         else:
             return jsonify({"error": "No data provided. Please provide either JSON or file input."}), 400
 
@@ -44,31 +87,56 @@ def two_sample_z_test_func():
             return jsonify({"error": "Sample sizes and standard deviations must be greater than zero."}), 400
 
         # Perform Two-Sample Z-Test
-        pooled_std = math.sqrt((std1 ** 2 / n1) + (std2 ** 2 / n2))
-        z_score = (mean1 - mean2) / pooled_std
-        p_value = 2 * (1 - norm.cdf(abs(z_score)))
-
-        # Confidence interval
-        mean_diff = mean1 - mean2
-        ci_low = mean_diff - 1.96 * pooled_std
-        ci_high = mean_diff + 1.96 * pooled_std
+        z_test = calculate_two_sample_z_test(mean1, mean2, std1, std2, n1, n2)
 
         # Prepare the results
-        results = {
-            "dataset_id": dataset_id,
-            "z_score": z_score,
-            "p_value": p_value,
-            "mean_difference": mean_diff,
-            "confidence_interval": {
-                "lower_bound": ci_low,
-                "upper_bound": ci_high
-            }
-        }
+        results = build_two_sample_results(
+            dataset_id, z_test["z_score"], z_test["p_value"], mean1 - mean2, z_test["confidence_interval"]
+        )
 
         # Process output data
         output_data = prepare_output_data(results)  # Assuming this function processes output data
         return jsonify(output_data), 200
 
+    except HTTPException:
+        # Let Flask answer request errors (e.g. 413 body too large) with their own status
+        raise
+    except Exception as e:
+        logger.error("Error during two-sample Z-test: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+@two_sample_z_test.route('/batch', methods=['POST'])
+def two_sample_z_test_batch_func():
+    try:
+
+        # Log the request
+        logger.info("Received a request to perform a batch of two sample Z-tests.")
+
+        data = request.get_json(cache=False, silent=True)
+        if not data:
+            return jsonify({"error": "No input data provided. Please provide JSON input."}), 400
+        error_message = check_two_sample_fields(data)
+        if error_message:
+            return jsonify({"error": error_message}), 400
+
+        # Each field holds one value per test
+        dataset_id, mean1, mean2, std1, std2, n1, n2 = _get_two_sample_fields(data)
+        try:
+            z_test = calculate_two_sample_z_test_batch(mean1, mean2, std1, std2, n1, n2)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        # Prepare the results
+        results = build_two_sample_results(
+            dataset_id, z_test["z_score"], z_test["p_value"], z_test["mean_difference"], z_test["confidence_interval"]
+        )
+
+        output_data = prepare_output_data(results)
+        return jsonify(output_data), 200
+
+    except HTTPException:
+        # Let Flask answer request errors (e.g. 413 body too large) with their own status
+        raise
     except Exception as e:
-        logger.error(f"Error during two-sample Z-test: {str(e)}")
+        logger.error("Error during batch two-sample Z-test: %s", e)
         return jsonify({"error": str(e)}), 500
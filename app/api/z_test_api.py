@@ -1,9 +1,9 @@
 from flask import Blueprint, request, jsonify
-from scipy.stats import norm
+from werkzeug.exceptions import HTTPException
+from scipy.special import ndtr
 import math
-from app.utils import read_input_data, prepare_output_data
+from app.utils import read_input_data, prepare_output_data, normal_two_tailed_p_value, z_critical_value
 from app.logger import logger
-from app import create_app  # Instead of from run import create_app
 
 
 z_test_api = Blueprint('z_test_api', __name__)
@@ -16,7 +16,7 @@ def z_test():
 
         # Check if JSON or file is provided
         if request.is_json:
-            data = request.get_json()
+            data = request.get_json(cache=False)
             groups = read_input_data(json_data=data)
         elif 'file' in request.files:
             file = request.files['file']
@@ -24,11 +24,9 @@ def z_test():
         else:
             return jsonify({"error": "No data provided. Please provide either JSON or file input."}), 400
 
-        # Extract necessary values
-        group_1 = groups.iloc[0]
-        group_2 = groups.iloc[1]
-        n1, p1 = group_1["size"], group_1["proportion"]
-        n2, p2 = group_2["size"], group_2["proportion"]
+        # Extract necessary values (one column conversion instead of per-row Series lookups)
+        n1, n2 = groups["size"].to_numpy(dtype=float)[:2].tolist()
+        p1, p2 = groups["proportion"].to_numpy(dtype=float)[:2].tolist()
 
         # Additional parameters
         alpha_value = float(request.form.get("alpha_value", 0.05))
@@ -39,16 +37,16 @@ def z_test():
         pooled_p = (n1 * p1 + n2 * p2) / (n1 + n2)
         standard_error = math.sqrt(pooled_p * (1 - pooled_p) * ((1 / n1) + (1 / n2)))
         z_score = (p1 - p2) / standard_error
-        p_value = 2 * (1 - norm.cdf(abs(z_score)))
+        p_value = normal_two_tailed_p_value(z_score)
 
         # Confidence interval
-        z_critical = norm.ppf(1 - (1 - confidence_interval / 100) / 2)
+        z_critical = z_critical_value(confidence_interval / 100)
         margin_of_error = z_critical * standard_error
         confidence_interval_lower = (p1 - p2) - margin_of_error
         confidence_interval_upper = (p1 - p2) + margin_of_error
 
         # Power of the test (using alpha value)
-        power = 1 - norm.cdf(z_critical - abs(z_score))
+        power = ndtr(abs(z_score) - z_critical)
 
         # Conclusion
         conclusion = "There is a significant difference in the proportions." if p_value < alpha_value else "No significant difference in the proportions."
@@ -75,6 +73,9 @@ def z_test():
         output_data = prepare_output_data(results, groups, confidence_interval)
         return jsonify(output_data), 200
 
+    except HTTPException:
+        # Let Flask answer request errors (e.g. 413 body too large) with their own status
+        raise
     except Exception as e:
-        logger.error(f"An error occurred: {str(e)}")
+        logger.error("An error occurred: %s", e)
         return jsonify({"error": str(e)}), 500
@@ -1,39 +1,56 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from flask.helpers import get_debug_flag
 
-def setup_logger(log_name, log_dir="logs", log_file="app.log", max_bytes=10 * 1024 * 1024, backup_count=3):
+def setup_logger(log_name, log_dir="logs", log_file="app.log", max_bytes=10 * 1024 * 1024, backup_count=3, file_level=None):
     """
     Set up and return a logger with rotating file handler and console handler.
+    Records are handed to a queue and written by a background listener thread,
+    so request threads never block on file I/O or log rotation.
     :param log_name: Name of the logger.
     :param log_dir: Directory where log files will be saved.
     :param log_file: The main log file name.
     :param max_bytes: Maximum file size before rotating.
     :param backup_count: Number of backup files to keep.
+    :param file_level: Level written to the log file (default: DEBUG if FLASK_DEBUG is set, else WARNING).
     :return: Configured logger.
     """
+    if file_level is None:
+        file_level = logging.DEBUG if get_debug_flag() else logging.WARNING
+
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
 
     log_path = os.path.join(log_dir, log_file)
 
+    # QueueHandler formats records on the calling thread, so drop anything no handler will write
+    # at the logger itself, before any formatting happens
+    console_level = logging.INFO
     logger = logging.getLogger(log_name)
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(min(file_level, console_level))
 
     # File handler with rotation
-    file_handler = RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backup_count)
-    file_handler.setLevel(logging.DEBUG)
+    file_handler = RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backup_count, delay=True)
+    file_handler.setLevel(file_level)
 
     # Console handler for real-time logs
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
+    console_handler.setLevel(console_level)
 
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Hand records to a background thread that writes them to both handlers
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
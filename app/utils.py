@@ -1,7 +1,18 @@
+from functools import lru_cache
+from importlib.util import find_spec
+from scipy.special import erfc, ndtri
+import numpy as np
 import pandas as pd
-from scipy.stats import norm
 import math
 
+SQRT1_2 = 1 / math.sqrt(2)
+
+# Two-tailed 95% critical value of the standard normal distribution, ndtri(0.975)
+Z_95 = 1.959963984540054
+
+# Rust-backed Excel reader, used when python-calamine is installed (openpyxl/xlrd otherwise)
+EXCEL_ENGINE = "calamine" if find_spec("python_calamine") else None
+
 # ---------------------------------------------
 # Input Data Handling
 # ---------------------------------------------
@@ -24,9 +35,10 @@ def read_input_data(json_data=None, file=None):
         if file:
             # Handle file input
             if file.filename.endswith('.csv'):
-                return pd.read_csv(file)
+                # The pyarrow engine parses in C++ across threads
+                return pd.read_csv(file, engine="pyarrow")
             elif file.filename.endswith(('.xls', '.xlsx')):
-                return pd.read_excel(file)
+                return pd.read_excel(file, engine=EXCEL_ENGINE)
             else:
                 raise ValueError("Unsupported file format. Please upload a CSV or Excel file.")
         
@@ -64,6 +76,12 @@ def validate_two_sample_input(data):
 # ---------------------------------------------
 # Output Data Preparation
 # ---------------------------------------------
+def _optional_float(value):
+    """
+    Cast a group value to float, keeping a missing (None) value as None.
+    """
+    return None if value is None else float(value)
+
 def prepare_output_data(results, groups=None, confidence_level=None):
     """
     Convert test results into a JSON-friendly format for output.
@@ -77,19 +95,17 @@ def prepare_output_data(results, groups=None, confidence_level=None):
     }
 
     if groups is not None:
+        # Convert the two group rows in one pass instead of building a Series per lookup
+        # (values are cast to float, as the numeric row Series used to return them)
+        records = groups.iloc[:2].to_dict("records")
         output["groups"] = [
             {
-                "group": 1,
-                "size": groups.iloc[0]["size"],
-                "mean": groups.iloc[0].get("mean"),
-                "std": groups.iloc[0].get("std"),
-            },
-            {
-                "group": 2,
-                "size": groups.iloc[1]["size"],
-                "mean": groups.iloc[1].get("mean"),
-                "std": groups.iloc[1].get("std"),
+                "group": group,
+                "size": float(record["size"]),
+                "mean": _optional_float(record.get("mean")),
+                "std": _optional_float(record.get("std")),
             }
+            for group, record in enumerate(records, start=1)
         ]
     
     if confidence_level is not None:
@@ -100,6 +116,23 @@ def prepare_output_data(results, groups=None, confidence_level=None):
 # ---------------------------------------------
 # Statistical Calculation Helpers
 # ---------------------------------------------
+def normal_two_tailed_p_value(z_score):
+    """
+    Two-tailed p-value of a standard normal test statistic, 2 * P(Z > |z|), as a single libm erfc call.
+    :param z_score: Z-Score
+    :return: P-Value
+    """
+    return math.erfc(abs(z_score) * SQRT1_2)
+
+@lru_cache(maxsize=256)
+def z_critical_value(confidence_level):
+    """
+    Two-tailed critical value of the standard normal distribution (cached per confidence level).
+    :param confidence_level: Confidence level (e.g., 0.95)
+    :return: Critical value
+    """
+    return ndtri(1 - (1 - confidence_level) / 2)
+
 def calculate_two_sample_z_test(mean1, mean2, std1, std2, n1, n2):
     """
     Perform a Two-Sample Z-Test.
@@ -111,21 +144,78 @@ def calculate_two_sample_z_test(mean1, mean2, std1, std2, n1, n2):
     :param n2: Sample size of sample 2
     :return: Z-Score, P-Value, and Confidence Interval
     """
+    z_score, p_value, confidence_interval = _two_sample_z_test(mean1, mean2, std1, std2, n1, n2)
+    return {
+        "z_score": z_score,
+        "p_value": p_value,
+        "confidence_interval": confidence_interval
+    }
+
+@lru_cache(maxsize=8192)
+def _two_sample_z_test(mean1, mean2, std1, std2, n1, n2):
+    """
+    Compute the Two-Sample Z-Test statistics as an immutable tuple.
+    The result depends only on the six summary statistics, so repeated inputs are served from the cache.
+    """
     # Calculate pooled standard error
-    pooled_se = math.sqrt((std1 ** 2 / n1) + (std2 ** 2 / n2))
-    z_score = (mean1 - mean2) / pooled_se
+    mean_diff = mean1 - mean2
+    pooled_se = math.sqrt((std1 * std1 / n1) + (std2 * std2 / n2))
+    z_score = mean_diff / pooled_se
 
     # Two-tailed p-value
-    p_value = 2 * (1 - norm.cdf(abs(z_score)))
+    p_value = normal_two_tailed_p_value(z_score)
 
-    # Confidence interval
+    # 95% confidence interval
+    margin_of_error = Z_95 * pooled_se
     confidence_interval = (
-        (mean1 - mean2) - 1.96 * pooled_se,
-        (mean1 - mean2) + 1.96 * pooled_se
+        mean_diff - margin_of_error,
+        mean_diff + margin_of_error
     )
 
+    return z_score, p_value, confidence_interval
+
+def calculate_two_sample_z_test_batch(mean1, mean2, std1, std2, n1, n2):
+    """
+    Perform many Two-Sample Z-Tests at once.
+    Each argument is a sequence with one entry per test; all statistics are computed in a single vectorized pass.
+    :param mean1: Means of sample 1
+    :param mean2: Means of sample 2
+    :param std1: Standard deviations of sample 1
+    :param std2: Standard deviations of sample 2
+    :param n1: Sample sizes of sample 1
+    :param n2: Sample sizes of sample 2
+    :return: Z-Scores, P-Values, Mean Differences and Confidence Intervals as NumPy arrays
+    """
+    try:
+        mean1, mean2, std1, std2, n1, n2 = (
+            np.asarray(values, dtype=np.float64) for values in (mean1, mean2, std1, std2, n1, n2)
+        )
+    except (TypeError, ValueError):
+        raise ValueError("All values in mean1, mean2, std1, std2, n1 and n2 must be numeric.")
+    if not (mean1.ndim == 1 and mean1.shape == mean2.shape == std1.shape == std2.shape == n1.shape == n2.shape):
+        raise ValueError("mean1, mean2, std1, std2, n1 and n2 must be lists of the same length.")
+    if not all(np.isfinite(values).all() for values in (mean1, mean2, std1, std2, n1, n2)):
+        raise ValueError("All values in mean1, mean2, std1, std2, n1 and n2 must be finite numbers.")
+
+    # Sample sizes are truncated to whole numbers, as int() does for a single test
+    n1, n2 = np.trunc(n1), np.trunc(n2)
+    if not ((n1 > 0).all() and (n2 > 0).all() and (std1 > 0).all() and (std2 > 0).all()):
+        raise ValueError("Sample sizes and standard deviations must be greater than zero.")
+
+    # Calculate pooled standard errors
+    mean_diff = mean1 - mean2
+    pooled_se = np.sqrt(std1 * std1 / n1 + std2 * std2 / n2)
+    z_score = mean_diff / pooled_se
+
+    # Two-tailed p-values (vectorized erfc; matches the scalar test up to rounding)
+    p_value = erfc(np.abs(z_score) * SQRT1_2)
+
+    # 95% confidence intervals
+    margin_of_error = Z_95 * pooled_se
+
     return {
         "z_score": z_score,
         "p_value": p_value,
-        "confidence_interval": confidence_interval
+        "mean_difference": mean_diff,
+        "confidence_interval": (mean_diff - margin_of_error, mean_diff + margin_of_error)
     }
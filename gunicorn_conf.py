@@ -0,0 +1,17 @@
+# gunicorn_conf.py
+#
+# Production entry point:
+#     gunicorn -c gunicorn_conf.py run:app
+
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# One worker process per core, each serving requests from a small thread pool
+workers = int(os.environ.get("GUNICORN_WORKERS", os.cpu_count() or 1))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+
+# The app is imported in each worker rather than preloaded in the master:
+# app.logger starts a QueueListener thread at import, and threads do not survive fork
+preload_app = False
@@ -1,13 +1,19 @@
 # run.py
 
+from flask.helpers import get_debug_flag
 from app import create_app  # Import the create_app function from the app package
 
-def main():
-    # Create the Flask application instance
-    app = create_app()
+# Create the Flask application instance (also the WSGI entry point: gunicorn -c gunicorn_conf.py run:app)
+app = create_app()
 
-    # Run the application
-    app.run(debug=True)
+def main():
+    # Run the application: the Werkzeug reloader/debugger only when FLASK_DEBUG is set,
+    # otherwise a multi-threaded production WSGI server
+    if get_debug_flag():
+        app.run(debug=True)
+    else:
+        from waitress import serve
+        serve(app, host="127.0.0.1", port=5000, threads=8)
 
 if __name__ == "__main__":
     main()
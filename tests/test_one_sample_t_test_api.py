@@ -0,0 +1,95 @@
+import math
+import pytest
+from app import create_app  # Import from the 'app' package
+
+
+@pytest.fixture
+def client():
+    app = create_app()
+    with app.test_client() as client:
+        yield client
+
+def t_test_payload(**overrides):
+    data = {
+        "sample_mean": 5.2,
+        "population_mean": 5,
+        "sample_std": 1.1,
+        "sample_size": 30,
+    }
+    data.update(overrides)
+    return data
+
+@pytest.mark.parametrize("alternative, p_value", [
+    ("not_equal", 0.32755591496979153),
+    ("greater", 0.16377795748489576),
+    ("less", 0.8362220425151042),
+])
+def test_one_sample_ttest_alternatives(client, alternative, p_value):
+    response = client.post('/ttest/one_sample_ttest', json=t_test_payload(alternative=alternative))
+
+    assert response.status_code == 200
+    results = response.json
+    assert results["dataset_id"] == "default_dataset"
+    assert results["t_score"] == pytest.approx(0.9958591954639392)
+    assert results["p_value"] == pytest.approx(p_value)
+    assert results["degrees_of_freedom"] == 29
+    assert results["confidence_interval"]["lower"] == pytest.approx(4.78925324956609)
+    assert results["confidence_interval"]["upper"] == pytest.approx(5.61074675043391)
+    assert results["conclusion"] == "Fail to reject null hypothesis"
+    assert len(results["plot_data"]["x_values"]) == 101
+    assert results["plot_data"]["y_values"][50] == pytest.approx(0.3955185790117269)
+
+def test_one_sample_ttest_missing_field(client):
+    data = t_test_payload()
+    del data["sample_std"]
+    response = client.post('/ttest/one_sample_ttest', json=data)
+
+    assert response.status_code == 400
+    assert response.json["error"] == "Missing required parameter: sample_std."
+
+@pytest.mark.parametrize("field, value", [
+    ("sample_mean", "5.2"),
+    ("sample_size", [30]),
+    ("sample_std", True),
+    ("confidence_level", {"value": 0.95}),
+])
+def test_one_sample_ttest_non_numeric_parameter(client, field, value):
+    response = client.post('/ttest/one_sample_ttest', json=t_test_payload(**{field: value}))
+
+    assert response.status_code == 400
+    assert response.json["error"] == f"Parameter {field} must be a number."
+
+@pytest.mark.parametrize("alternative", ["two_sided", ["less"], {"x": 1}])
+def test_one_sample_ttest_invalid_alternative(client, alternative):
+    response = client.post('/ttest/one_sample_ttest', json=t_test_payload(alternative=alternative))
+
+    assert response.status_code == 400
+    assert "Invalid alternative hypothesis" in response.json["error"]
+
+def test_one_sample_ttest_sample_size_too_small(client):
+    response = client.post('/ttest/one_sample_ttest', json=t_test_payload(sample_size=1))
+
+    assert response.status_code == 400
+    assert "greater than one" in response.json["error"]
+
+@pytest.mark.parametrize("confidence_level, lower, upper", [
+    (0.9999996, 3.8931151731287086, 6.506884826871292),
+    (0.9999999, 3.789047830077358, 6.610952169922642),
+    (1e-07, 5.199999974611609, 5.200000025388391),
+])
+def test_one_sample_ttest_extreme_confidence_level(client, confidence_level, lower, upper):
+    response = client.post('/ttest/one_sample_ttest', json=t_test_payload(confidence_level=confidence_level))
+
+    assert response.status_code == 200
+    interval = response.json["confidence_interval"]
+    assert math.isfinite(interval["lower"]) and math.isfinite(interval["upper"])
+    assert interval["lower"] < interval["upper"]
+    assert interval["lower"] == pytest.approx(lower, rel=1e-9)
+    assert interval["upper"] == pytest.approx(upper, rel=1e-9)
+
+@pytest.mark.parametrize("body", [[1, 2], "abc"])
+def test_one_sample_ttest_non_object_body(client, body):
+    response = client.post('/ttest/one_sample_ttest', json=body)
+
+    assert response.status_code == 400
+    assert response.json["error"] == "Input JSON must be an object."
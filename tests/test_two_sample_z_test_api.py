@@ -0,0 +1,107 @@
+import io
+import pytest
+from app import create_app  # Import from the 'app' package
+
+
+@pytest.fixture
+def client():
+    app = create_app()
+    with app.test_client() as client:
+        yield client
+
+def batch_payload(**overrides):
+    data = {
+        "dataset_id": "batch",
+        "mean1": [5, 6.2],
+        "mean2": [4.5, 6],
+        "std1": [1, 2],
+        "std2": [1.2, 1.5],
+        "n1": [40, 25],
+        "n2": [50, 30],
+    }
+    data.update(overrides)
+    return data
+
+def test_two_sample_ztest_file_upload(client):
+    csv = b"dataset_id,mean1,mean2,std1,std2,n1,n2\nd1,5,4.5,1,1.2,40,50\n"
+    response = client.post('/api/', data={"file": (io.BytesIO(csv), "input.csv")}, content_type="multipart/form-data")
+
+    assert response.status_code == 200
+    results = response.json["results"]
+    assert results["dataset_id"] == "d1"
+    assert results["mean_difference"] == 0.5
+    assert results["z_score"] == pytest.approx(2.155653067796134)
+
+def test_two_sample_ztest_batch_matches_single(client):
+    data = batch_payload()
+    response = client.post('/api/batch', json=data)
+
+    assert response.status_code == 200
+    batch = response.json["results"]
+    for i in range(2):
+        single = client.post('/api/', json={
+            "dataset_id": "batch",
+            **{key: data[key][i] for key in ("mean1", "mean2", "std1", "std2", "n1", "n2")},
+        }).json["results"]
+        assert batch["z_score"][i] == pytest.approx(single["z_score"])
+        assert batch["p_value"][i] == pytest.approx(single["p_value"])
+        assert batch["mean_difference"][i] == pytest.approx(single["mean_difference"])
+        assert batch["confidence_interval"]["lower_bound"][i] == pytest.approx(single["confidence_interval"]["lower_bound"])
+        assert batch["confidence_interval"]["upper_bound"][i] == pytest.approx(single["confidence_interval"]["upper_bound"])
+
+def test_two_sample_ztest_missing_field(client):
+    response = client.post('/api/', json={"dataset_id": "d1", "mean1": 5, "mean2": 4.5, "std1": 1, "std2": 1.2, "n1": 40})
+
+    assert response.status_code == 400
+    assert response.json["error"] == "Missing required parameter: n2."
+
+def test_two_sample_ztest_non_object_body(client):
+    response = client.post('/api/', json=[1, 2, 3])
+
+    assert response.status_code == 400
+    assert response.json["error"] == "Input JSON must be an object."
+
+def test_two_sample_ztest_batch_mismatched_lengths(client):
+    response = client.post('/api/batch', json=batch_payload(mean1=[5]))
+
+    assert response.status_code == 400
+    assert "same length" in response.json["error"]
+
+def test_two_sample_ztest_batch_non_positive_std(client):
+    response = client.post('/api/batch', json=batch_payload(std1=[1, 0]))
+
+    assert response.status_code == 400
+    assert "greater than zero" in response.json["error"]
+
+def test_two_sample_ztest_batch_null_values(client):
+    response = client.post('/api/batch', json=batch_payload(mean1=[5, None], std1=[1, None]))
+
+    assert response.status_code == 400
+    assert "finite" in response.json["error"]
+
+def test_two_sample_ztest_batch_missing_field(client):
+    data = batch_payload()
+    del data["n2"]
+    response = client.post('/api/batch', json=data)
+
+    assert response.status_code == 400
+    assert response.json["error"] == "Missing required parameter: n2."
+
+def test_two_sample_ztest_batch_non_object_body(client):
+    response = client.post('/api/batch', json=[1, 2, 3])
+
+    assert response.status_code == 400
+
+def test_two_sample_ztest_rejects_oversized_body(client):
+    body = b'{"dataset_id": "' + b"x" * (2 << 20) + b'"}'
+    response = client.post('/api/', data=body, content_type="application/json")
+
+    assert response.status_code == 413
+    assert "error" in response.json
+
+def test_two_sample_ztest_method_not_allowed_keeps_allow_header(client):
+    response = client.get('/api/')
+
+    assert response.status_code == 405
+    assert "POST" in response.headers["Allow"]
+    assert "error" in response.json